@@ -0,0 +1,31 @@
+"""
+Sage SMS Package
+
+The public entry points are exposed lazily (PEP 562): importing `sage_sms`
+does not import the factory or the validators, nor their dependencies,
+until one of them is first accessed.
+"""
+
+from importlib import import_module
+from typing import Any, List
+
+__all__ = ["SMSBackendFactory", "PhoneNumberValidator"]
+
+_LAZY_ATTRIBUTES = {
+    "SMSBackendFactory": "sage_sms.factory",
+    "PhoneNumberValidator": "sage_sms.validators",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_path = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,4 +1,7 @@
 import sys
+from typing import Iterable
+
+_SEP = "-" * 79
 
 
 class BaseSMSBackend:
@@ -20,11 +23,14 @@ class ConsoleSMSBackend(BaseSMSBackend):
     Args:
         settings (dict): The settings for the SMS backend.
         stream: The output stream where messages will be written (default is sys.stdout).
+        flush (bool): Whether to flush the stream after every single message
+            (default is False). Bulk sends always flush once at the end.
     """
 
-    def __init__(self, settings: dict, stream=None):
+    def __init__(self, settings: dict, stream=None, flush: bool = False):
         super().__init__(settings)
         self.stream = stream or sys.stdout
+        self._flush = flush
 
     def _write_message(self, message: str):
         """
@@ -33,9 +39,29 @@ class ConsoleSMSBackend(BaseSMSBackend):
         Args:
             message (str): The message to be written.
         """
-        self.stream.write(f"\n{message}")
-        self.stream.write("-" * 79)
-        self.stream.write("\n")
+        self.stream.write(f"\n{message}{_SEP}\n")
+        if self._flush:
+            self.stream.flush()
+
+    def _write_many(self, records: Iterable[str]):
+        """
+        Write several preformatted records to the output stream and flush once.
+
+        The records are consumed lazily, so a generator is never materialized.
+        Streams that only provide `write` get the records joined into a single
+        write, and are flushed only if they support it.
+
+        Args:
+            records (Iterable[str]): The records to be written, separators included.
+        """
+        writelines = getattr(self.stream, "writelines", None)
+        if writelines is None:
+            self.stream.write("".join(records))
+        else:
+            writelines(records)
+        flush = getattr(self.stream, "flush", None)
+        if flush is not None:
+            flush()
 
     def send_one_message(
         self, phone_number: str, message: str, line_number: str | None = None
@@ -64,8 +90,10 @@ class ConsoleSMSBackend(BaseSMSBackend):
             message (str): The SMS message to be sent.
             line_number (str, optional): The line number used for sending the message.
         """
-        for phone_number in phone_numbers:
-            self.send_one_message(phone_number, message, line_number)
+        suffix = f"\nMessage: {message}\nLine Number: {line_number}{_SEP}\n"
+        self._write_many(
+            f"\nRecipient: {phone_number}{suffix}" for phone_number in phone_numbers
+        )
 
     def send_verify_message(self, phone_number: str, value: str):
         """
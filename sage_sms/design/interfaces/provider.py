@@ -9,15 +9,23 @@ Classes:
     - ISmsProviderFactory: Interface for factories creating SMS providers.
     - ISmsProvider: Interface for SMS providers.
 
+Functions:
+    - sms_provider: Decorator registering an SMS provider under a name.
+    - get_sms_provider: Look up a registered SMS provider.
+
 Usage:
     Implement these interfaces when creating new classes for SMS providers.
+    Optionally decorate the class with `sms_provider` so the factory can
+    resolve it without scanning its module.
 
 Exceptions:
     NotImplementedError: Raised when an implemented method does not
     meet the requirements of the interface.
 """
 
+import sys
 from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional, Tuple, Type
 
 
 class ISmsProviderFactory(ABC):
@@ -102,3 +110,59 @@ class ISmsProvider(ABC):
             NotImplementedError: This method must be implemented by a subclass.
         """
         raise NotImplementedError
+
+
+_REGISTRY: Dict[Tuple[str, str], Type[ISmsProvider]] = {}
+
+
+def sms_provider(
+    name: str,
+) -> Callable[[Type[ISmsProvider]], Type[ISmsProvider]]:
+    """
+    Register an SMS provider class under the given provider name.
+
+    The name is the provider `NAME` used in the settings, which is also the
+    name of the backend module the class is defined in. The registration is
+    scoped to the package containing that module, so it is only used by
+    factories whose base package is that package.
+
+    The factory only imports `{base_package}.{NAME}`, so a class registered
+    under any other name could only be found once something else had
+    imported its module; the decorator rejects such a name instead.
+
+    Args:
+        name (str): The name of the provider.
+
+    Returns:
+        Callable: A class decorator that registers and returns the class.
+
+    Raises:
+        ValueError: If the name differs from the backend module's name.
+    """
+
+    def decorator(provider_class: Type[ISmsProvider]) -> Type[ISmsProvider]:
+        package, _, module_name = provider_class.__module__.rpartition(".")
+        if name != module_name:
+            raise ValueError(
+                f"Provider {provider_class.__qualname__} is registered as "
+                f"{name!r} but defined in module {module_name!r}; the name "
+                "must match the backend module's name."
+            )
+        _REGISTRY[(package, sys.intern(name))] = provider_class
+        return provider_class
+
+    return decorator
+
+
+def get_sms_provider(base_package: str, name: str) -> Optional[Type[ISmsProvider]]:
+    """
+    Return the SMS provider class registered under a name in a package.
+
+    Args:
+        base_package (str): The package containing the backend module.
+        name (str): The name of the provider.
+
+    Returns:
+        Type[ISmsProvider] | None: The registered class, or None if there is none.
+    """
+    return _REGISTRY.get((base_package, name))
@@ -1,10 +1,13 @@
 import logging
-import os
+import sys
+import warnings
+from collections import deque
 from importlib import import_module
-from typing import ClassVar, Dict
+from types import ModuleType
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, Type
 
 from sage_sms.backends.base import ConsoleSMSBackend
-from sage_sms.design.interfaces.provider import ISmsProvider
+from sage_sms.design.interfaces.provider import ISmsProvider, get_sms_provider
 from sage_sms.helper.exceptions import (
     SMSBackendError,
     SMSConfigurationError,
@@ -15,51 +18,99 @@ from sage_sms.helper.type import ProviderSettings, SMSSettings
 
 logger = logging.getLogger(__name__)
 
+_CACHED_BACKENDS: Dict[Tuple[str, str], type] = {}
+
 
 class BackendModuleLoader:
     """
-    A class responsible for discovering and loading SMS backend modules.
+    A class responsible for loading SMS backend modules.
+
+    Backend modules are imported lazily: only the module of the requested
+    provider is imported, the first time that provider is loaded. Loaded
+    classes are cached per base package and provider name.
 
     Attributes:
-        _cached_backends (ClassVar[Dict[str, type]]): A class variable for caching backend classes.
-        _provider_classname_map (ClassVar[Dict[str, type]]): A class variable for mapping provider names to class names.
+        _cached_backends (ClassVar[Dict[Tuple[str, str], type]]): An alias of the module-level backend class cache.
     """
 
-    _cached_backends: ClassVar[Dict[str, type]] = {}
-    _provider_classname_map: ClassVar[Dict[str, type]] = {}
+    _cached_backends: ClassVar[Dict[Tuple[str, str], type]] = _CACHED_BACKENDS
 
     @classmethod
-    def discover_backends(cls, base_package: str):
+    def discover_backends(cls, base_package: str) -> None:
+        """
+        Deprecated no-op, kept for backward compatibility.
+
+        Backend modules are no longer discovered up front:
+        `load_backend_module` imports the module of the requested provider on
+        first use, so there is nothing to do here.
+
+        Args:
+            base_package (str): The base package where backend modules are located.
+        """
+        warnings.warn(
+            "BackendModuleLoader.discover_backends() is deprecated and does "
+            "nothing; backends are loaded on first use.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+    @staticmethod
+    def _find_provider_class(
+        module: ModuleType, base_package: str, provider_name: str
+    ) -> Optional[Type[ISmsProvider]]:
         """
-        Discover backend modules in the specified base package.
+        Find the provider class defined by a backend module.
+
+        The class registered under the provider name wins, then the module's
+        `BACKEND_CLASS` attribute; otherwise the first `ISmsProvider` subclass
+        defined in the module is used, found by walking the subclass tree the
+        interpreter already maintains rather than scanning module members.
+        Modules that only import a provider class from elsewhere define none,
+        so the module members are scanned for one as a last resort.
 
         Args:
+            module (ModuleType): The imported backend module.
             base_package (str): The base package where backend modules are located.
+            provider_name (str): The name of the provider.
+
+        Returns:
+            Type[ISmsProvider] | None: The provider class, or None if the
+                module has none.
         """
-        logger.debug(f"Discovering backends in package: {base_package}")
-        base_path = base_package.replace(".", "/")
-        for root, _, files in os.walk(base_path):
-            for file in files:
-                if file.endswith(".py") and file != "__init__.py":
-                    module_name = file[:-3]  # Strip '.py' extension
-                    module = import_module(f"{base_package}.{module_name}")
-                    for name, obj in module.__dict__.items():
-                        if (
-                            isinstance(obj, type)
-                            and issubclass(obj, ISmsProvider)
-                            and obj is not ISmsProvider
-                        ):
-                            cls._provider_classname_map[module_name] = obj.__name__
-                            logger.debug(
-                                f"Found provider: {module_name}.{obj.__name__}"
-                            )
-                            break
+        provider_class = get_sms_provider(base_package, provider_name) or getattr(
+            module, "BACKEND_CLASS", None
+        )
+        if provider_class is not None:
+            return provider_class
+        pending = deque(ISmsProvider.__subclasses__())
+        while pending:
+            candidate = pending.popleft()
+            if candidate.__module__ == module.__name__:
+                return candidate
+            pending.extend(candidate.__subclasses__())
+        for obj in vars(module).values():
+            if (
+                isinstance(obj, type)
+                and issubclass(obj, ISmsProvider)
+                and obj is not ISmsProvider
+            ):
+                return obj
+        return None
 
     @staticmethod
-    def load_backend_module(provider: ProviderSettings, base_package: str):
+    def load_backend_module(
+        provider: ProviderSettings,
+        base_package: str,
+        *,
+        _import: Callable[[str], ModuleType] = import_module,
+        _cache: Dict[Tuple[str, str], type] = _CACHED_BACKENDS,
+    ) -> type:
         """
         Load the backend module for the specified provider.
 
+        `_import` and `_cache` are bound at definition time so the lookups
+        are local variable reads; they are not meant to be passed.
+
         Args:
             provider (ProviderSettings): The settings for the provider.
             base_package (str): The base package where backend modules are located.
@@ -68,29 +119,56 @@ class BackendModuleLoader:
             type: The backend class for the specified provider.
 
         Raises:
-            SMSConfigurationError: If the provider key is missing in settings.
+            SMSConfigurationError: If the provider key is missing in settings,
+                or the provider NAME is not a string.
             SMSProviderNotFoundError: If the provider is not supported.
         """
-        provider_name = provider.get("NAME")
-        logger.debug(f"Loading backend module for provider: {provider_name}")
-
-        if not provider_name:
+        try:
+            provider_name = provider["NAME"]
+        except (KeyError, TypeError):
+            provider_name = None
+        if provider_name is None or provider_name == "":
             logger.error("Provider key is missing in settings.")
             raise SMSConfigurationError("Provider key is missing in settings.")
-
-        if provider_name not in BackendModuleLoader._provider_classname_map:
-            logger.error(f"Unsupported provider: {provider_name}")
-            raise SMSProviderNotFoundError(f"Unsupported provider: {provider_name}")
-
-        if provider_name in BackendModuleLoader._cached_backends:
-            logger.debug(f"Using cached backend for provider: {provider_name}")
-            return BackendModuleLoader._cached_backends[provider_name]
-
-        class_name = BackendModuleLoader._provider_classname_map[provider_name]
-        module = import_module(f"{base_package}.{provider_name}")
-        provider_class = getattr(module, class_name)
-        BackendModuleLoader._cached_backends[provider_name] = provider_class
-        logger.debug(f"Loaded backend module: {provider_name}.{class_name}")
+        try:
+            provider_name = sys.intern(provider_name)
+        except TypeError:
+            logger.error("Provider NAME must be a string: %r", provider_name)
+            raise SMSConfigurationError(
+                f"Provider NAME must be a string, got {type(provider_name).__name__}."
+            ) from None
+
+        cache_key = (base_package, provider_name)
+        provider_class = _cache.get(cache_key)
+        if provider_class is not None:
+            return provider_class
+
+        logger.debug("Loading backend module for provider: %s", provider_name)
+
+        provider_class = get_sms_provider(base_package, provider_name)
+        if provider_class is None:
+            module_path = f"{base_package}.{provider_name}"
+            try:
+                module = _import(module_path)
+            except ModuleNotFoundError as e:
+                if e.name != module_path:
+                    raise
+                logger.error("Unsupported provider: %s", provider_name)
+                raise SMSProviderNotFoundError(
+                    f"Unsupported provider: {provider_name}"
+                ) from None
+
+            provider_class = BackendModuleLoader._find_provider_class(
+                module, base_package, provider_name
+            )
+            if provider_class is None:
+                logger.error("Unsupported provider: %s", provider_name)
+                raise SMSProviderNotFoundError(f"Unsupported provider: {provider_name}")
+
+        _cache[cache_key] = provider_class
+        logger.debug(
+            "Loaded backend module: %s.%s", provider_name, provider_class.__name__
+        )
         return provider_class
 
 
@@ -98,6 +176,11 @@ class SMSBackendFactory:
     """
     A factory class for creating SMS backend instances.
 
+    The backend class is resolved once at construction time, so configuration
+    errors surface immediately and `get_backend` is a plain attribute read.
+    Only the configured provider's module is imported, and nothing is
+    imported in debug mode.
+
     Args:
         settings (SMSSettings): The settings for SMS backend configuration.
         base_package (str): The base package where backend modules are located.
@@ -105,21 +188,20 @@ class SMSBackendFactory:
     Attributes:
         settings (SMSSettings): The settings for SMS backend configuration.
         base_package (str): The base package where backend modules are located.
+
+    Raises:
+        SMSBackendError: If there is an error with the SMS backend.
+        SMSUnexpectedError: If an unexpected error occurs.
     """
 
     def __init__(self, settings: SMSSettings, base_package: str):
         self.settings = settings
         self.base_package = base_package
-        try:
-            BackendModuleLoader.discover_backends(base_package)
-            logger.debug(f"Discovered backends for package: {base_package}")
-        except Exception as e:
-            logger.exception(f"Unexpected error during backend discovery: {e}")
-            raise SMSUnexpectedError(f"Unexpected error during backend discovery: {e}")
+        self._backend_cls = self._resolve_backend()
 
-    def get_backend(self, *args, **kwargs):
+    def _resolve_backend(self) -> type:
         """
-        Get the SMS backend instance based on the provided settings.
+        Resolve the backend class based on the provided settings.
 
         Returns:
             type: The backend class for sending SMS messages.
@@ -136,11 +218,20 @@ class SMSBackendFactory:
             backend_class = BackendModuleLoader.load_backend_module(
                 self.settings.get("provider"), self.base_package
             )
-            logger.debug(f"Loaded backend class: {backend_class}")
+            logger.debug("Loaded backend class: %s", backend_class)
             return backend_class
-        except SMSBackendError as e:
-            logger.exception(f"SMSBackendError occurred: {e}")
-            raise e
+        except SMSBackendError:
+            raise
         except Exception as e:
-            logger.exception(f"Unexpected error while getting backend: {e}")
-            raise SMSUnexpectedError(f"Unexpected error while getting backend: {e}")
+            raise SMSUnexpectedError(
+                f"Unexpected error while getting backend: {e}"
+            ) from e
+
+    def get_backend(self, *args: Any, **kwargs: Any) -> type:
+        """
+        Get the SMS backend class resolved for the provided settings.
+
+        Returns:
+            type: The backend class for sending SMS messages.
+        """
+        return self._backend_cls
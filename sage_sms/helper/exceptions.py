@@ -1,12 +1,25 @@
-from typing import Optional
+from typing import Any, Optional
 
 
 class SMSBackendError(Exception):
-    """Base class for all SMS backend exceptions."""
+    """Base class for all SMS backend exceptions.
+
+    The defaults live on the class; instances only store the values that
+    the caller overrides.
+    """
 
     status_code: int = 500
     default_detail: str = "A server error occurred."
     default_code: str = "error"
+    detail: str = default_detail
+    code: str = default_code
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "detail" not in cls.__dict__:
+            cls.detail = cls.default_detail
+        if "code" not in cls.__dict__:
+            cls.code = cls.default_code
 
     def __init__(
         self,
@@ -14,15 +27,12 @@ class SMSBackendError(Exception):
         code: Optional[str] = None,
         status_code: Optional[int] = None,
     ):
-        if detail is None:
-            detail = self.default_detail
-        if code is None:
-            code = self.default_code
-        if status_code is None:
-            status_code = self.status_code
-        self.detail: str = detail
-        self.code: str = code
-        self.status_code: int = status_code
+        if detail is not None:
+            self.detail = detail
+        if code is not None:
+            self.code = code
+        if status_code is not None:
+            self.status_code = status_code
 
     def __str__(self) -> str:
         return f"{self.detail} (Code: {self.code}, Status Code: {self.status_code})"
@@ -1,40 +1,122 @@
-from typing import Any, Optional
+import re
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Iterable, List, Optional, Union, overload
 
-try:
-    import phonenumbers
-except ImportError:
-    phonenumbers = None
+# A "0" within the first three digits may be a trunk prefix written after a
+# one to three digit country code ("+98 0912..."), so such numbers are left
+# to `phonenumbers`, which drops it or keeps it (Italy) as the region needs.
+_is_e164 = re.compile(r"\+[1-9]{4}[0-9]{3,11}").fullmatch
+_STRIP = str.maketrans("", "", " -.\t")
+
+
+@lru_cache(maxsize=None)
+def _get_phonenumbers() -> ModuleType:
+    """
+    Import `phonenumbers` on first use.
+
+    The package loads its metadata at import time, so it is deferred until a
+    number actually needs parsing.
+
+    Returns:
+        ModuleType: The `phonenumbers` module.
+
+    Raises:
+        ImportError: If the `phonenumbers` package is not installed.
+    """
+    try:
+        import phonenumbers
+    except ImportError:
+        raise ImportError(
+            "Install `phonenumbers` package. Run `poetry add phonenumbers`."
+        ) from None
+    return phonenumbers
+
+
+@lru_cache(maxsize=4096)
+def _parse_e164(phone_number: str, region: Optional[str]) -> str:
+    """
+    Parse a phone number and format it in E.164.
+
+    Results are cached, so repeated numbers skip `phonenumbers` parsing.
+
+    Args:
+        phone_number (str): The phone number to parse.
+        region (Optional[str]): The region code for phone number parsing.
+
+    Returns:
+        str: The phone number in E.164 format.
+
+    Raises:
+        ImportError: If the `phonenumbers` package is not installed.
+    """
+    phonenumbers = _get_phonenumbers()
+    parsed_number = phonenumbers.parse(phone_number, region)
+    return phonenumbers.format_number(
+        parsed_number, phonenumbers.PhoneNumberFormat.E164
+    )
+
+
+def _format_e164(phone_number: str, region: Optional[str]) -> str:
+    """
+    Format a phone number in E.164, skipping parsing when it already is.
+
+    Numbers with a "0" in their first four digits are always parsed, since
+    it may be a trunk prefix that E.164 omits.
+
+    Spaces, dashes and dots are stripped first, so E.164 numbers written with
+    the usual separators also take the fast path. Parentheses are kept, since
+    they may enclose a trunk prefix such as "(0)" that must not become part
+    of the number; such input is left to `phonenumbers`.
+
+    Args:
+        phone_number (str): The phone number to format.
+        region (Optional[str]): The region code for phone number parsing.
+
+    Returns:
+        str: The phone number in E.164 format.
+    """
+    candidate = phone_number.translate(_STRIP)
+    if _is_e164(candidate):
+        return candidate
+    return _parse_e164(phone_number, region)
 
 
 class PhoneNumberDescriptor:
     """
     Descriptor class for phone number validation and formatting.
 
+    The formatted value is stored on the instance under the attribute name
+    prefixed with an underscore, so owners may declare it in `__slots__`.
+
     Args:
         name (str): The name of the phone number attribute.
         region (Optional[str]): The region code for phone number parsing.
     """
 
+    __slots__ = ("name", "region", "_storage_name")
+
     def __init__(self, name: str, region: Optional[str] = None) -> None:
         self.name: str = name
         self.region: Optional[str] = region
+        self._storage_name: str = f"_{name}"
+
+    @overload
+    def __get__(self, instance: None, owner: Any) -> "PhoneNumberDescriptor": ...
 
-    def __get__(self, instance: Any, owner: Any) -> str:
-        value = instance.__dict__.get(self.name)
+    @overload
+    def __get__(self, instance: object, owner: Any) -> str: ...
+
+    def __get__(self, instance: Any, owner: Any) -> Union["PhoneNumberDescriptor", str]:
+        if instance is None:
+            return self
+        value = getattr(instance, self._storage_name, None)
         if value is None:
             raise ValueError(f"{self.name} is not set.")
         return value
 
     def __set__(self, instance: Any, value: str) -> None:
-        if phonenumbers is None:
-            raise ImportError(
-                "Install `phonenumbers` package. Run `poetry add phonenumbers`."
-            )
-        parsed_number = phonenumbers.parse(value, self.region)
-        formatted_number = phonenumbers.format_number(
-            parsed_number, phonenumbers.PhoneNumberFormat.E164
-        )
-        instance.__dict__[self.name] = formatted_number
+        setattr(instance, self._storage_name, _format_e164(value, self.region))
 
     def __delete__(self, instance: Any) -> None:
         raise AttributeError("Cannot delete the attribute.")
@@ -50,6 +132,8 @@ class PhoneNumberValidator:
         phone_number (PhoneNumberDescriptor): The phone number descriptor.
     """
 
+    __slots__ = ("_phone_number", "region")
+
     phone_number: PhoneNumberDescriptor = PhoneNumberDescriptor("phone_number")
 
     def __init__(self, phone_number: str, region: Optional[str] = None) -> None:
@@ -61,9 +145,34 @@ class PhoneNumberValidator:
         Validate and format the phone number.
 
         The method uses the `phonenumbers` library to validate and format
-        the phone number. The format used is E.164.
+        the phone number. The format used is E.164. Numbers that are in E.164
+        format once spaces, dashes and dots are stripped (ASCII digits only,
+        with no "0" that could be a trunk prefix) are returned in that
+        stripped form without invoking `phonenumbers`; that check covers the
+        shape of the number only, so a well-formed number with an unassigned
+        country code is not rejected.
 
         Returns:
             str: The validated and formatted phone number in E.164 format.
         """
         return self.phone_number
+
+    @staticmethod
+    def validate_and_format_many(
+        phone_numbers: Iterable[str], region: Optional[str] = None
+    ) -> List[str]:
+        """
+        Validate and format several phone numbers at once.
+
+        Numbers already in E.164 format are returned stripped, without
+        touching `phonenumbers` (see `validate_and_format` for the limits of
+        that check); the rest are parsed and formatted to E.164.
+
+        Args:
+            phone_numbers (Iterable[str]): The phone numbers to format.
+            region (Optional[str]): The region code for phone number parsing.
+
+        Returns:
+            List[str]: The formatted phone numbers, in the input order.
+        """
+        return [_format_e164(phone_number, region) for phone_number in phone_numbers]
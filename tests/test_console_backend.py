@@ -0,0 +1,71 @@
+import io
+
+import pytest
+
+from sage_sms.backends.base import ConsoleSMSBackend
+
+
+class WriteOnlyStream:
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, text):
+        self.chunks.append(text)
+
+    def getvalue(self):
+        return "".join(self.chunks)
+
+
+class FlushCountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+PHONE_NUMBERS = ["+989121234567", "+989121234568", "+989121234569"]
+
+
+def per_message_output(phone_numbers, message, line_number):
+    stream = io.StringIO()
+    backend = ConsoleSMSBackend({}, stream)
+    for phone_number in phone_numbers:
+        backend.send_one_message(phone_number, message, line_number)
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize("stream_class", [io.StringIO, WriteOnlyStream])
+def test_bulk_output_matches_per_message_output(stream_class):
+    stream = stream_class()
+    ConsoleSMSBackend({}, stream).send_bulk_messages(PHONE_NUMBERS, "Hello", "3000")
+    assert stream.getvalue() == per_message_output(PHONE_NUMBERS, "Hello", "3000")
+
+
+def test_write_only_stream_gets_a_single_write():
+    stream = WriteOnlyStream()
+    ConsoleSMSBackend({}, stream).send_bulk_messages(PHONE_NUMBERS, "Hello")
+    assert len(stream.chunks) == 1
+
+
+def test_bulk_send_flushes_once():
+    stream = FlushCountingStream()
+    ConsoleSMSBackend({}, stream).send_bulk_messages(PHONE_NUMBERS, "Hello")
+    assert stream.flushes == 1
+
+
+@pytest.mark.parametrize("flush, expected", [(False, 0), (True, 1)])
+def test_single_message_flushes_only_on_request(flush, expected):
+    stream = FlushCountingStream()
+    ConsoleSMSBackend({}, stream, flush=flush).send_one_message("+1", "Hi")
+    assert stream.flushes == expected
+
+
+def test_verify_message_format():
+    stream = io.StringIO()
+    ConsoleSMSBackend({}, stream).send_verify_message("+989121234567", "1234")
+    assert stream.getvalue() == (
+        "\nRecipient: +989121234567\nVerification Code: 1234" + "-" * 79 + "\n"
+    )
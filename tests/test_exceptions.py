@@ -0,0 +1,40 @@
+from sage_sms.helper.exceptions import (
+    SMSBackendError,
+    SMSConfigurationError,
+    SMSProviderNotFoundError,
+)
+
+
+def test_defaults_come_from_the_class():
+    error = SMSConfigurationError()
+    assert (error.detail, error.code, error.status_code) == (
+        "Invalid SMS configuration.",
+        "configuration_error",
+        400,
+    )
+    assert vars(error) == {}
+    assert str(error) == (
+        "Invalid SMS configuration. (Code: configuration_error, Status Code: 400)"
+    )
+
+
+def test_overrides_are_stored_on_the_instance():
+    error = SMSProviderNotFoundError("Unsupported provider: x", "c", 418)
+    assert str(error) == "Unsupported provider: x (Code: c, Status Code: 418)"
+    assert SMSProviderNotFoundError().detail == "SMS provider not found."
+
+
+def test_str_reflects_later_changes():
+    error = SMSBackendError()
+    error.detail = "Changed."
+    assert str(error) == "Changed. (Code: error, Status Code: 500)"
+
+
+def test_subclass_without_super_init_renders():
+    class CustomError(SMSBackendError):
+        def __init__(self):
+            pass
+
+    assert str(CustomError()) == (
+        "A server error occurred. (Code: error, Status Code: 500)"
+    )
@@ -0,0 +1,240 @@
+import sys
+import textwrap
+from importlib import import_module
+
+import pytest
+
+from sage_sms.backends.base import ConsoleSMSBackend
+from sage_sms.design.interfaces import provider as provider_module
+from sage_sms.factory import _CACHED_BACKENDS, BackendModuleLoader, SMSBackendFactory
+from sage_sms.helper.exceptions import (
+    SMSConfigurationError,
+    SMSProviderNotFoundError,
+    SMSUnexpectedError,
+)
+
+PROVIDER_BASE = """
+from sage_sms.design.interfaces.provider import ISmsProvider
+
+
+class {name}(ISmsProvider):
+    def __init__(self, settings):
+        self.settings = settings
+
+    def send_one_message(self, phone_number, message, linenumber=None):
+        pass
+
+    def send_bulk_messages(self, phone_numbers, message, linenumber=None):
+        pass
+
+    def send_verify_message(self, phone_number, value):
+        pass
+"""
+
+
+@pytest.fixture(autouse=True)
+def isolated_loader():
+    registry = dict(provider_module._REGISTRY)
+    cache = dict(_CACHED_BACKENDS)
+    modules = set(sys.modules)
+    yield
+    provider_module._REGISTRY.clear()
+    provider_module._REGISTRY.update(registry)
+    _CACHED_BACKENDS.clear()
+    _CACHED_BACKENDS.update(cache)
+    for name in set(sys.modules) - modules:
+        del sys.modules[name]
+
+
+@pytest.fixture
+def make_package(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def make(package, modules):
+        package_dir = tmp_path / package
+        package_dir.mkdir()
+        (package_dir / "__init__.py").write_text("")
+        for module_name, source in modules.items():
+            (package_dir / f"{module_name}.py").write_text(textwrap.dedent(source))
+        return package
+
+    return make
+
+
+def settings(name, debug=False):
+    return {"debug": debug, "provider": {"NAME": name}}
+
+
+def test_debug_mode_uses_console_backend_without_imports():
+    factory = SMSBackendFactory(settings("anything", debug=True), "no_such_package")
+    assert factory.get_backend() is ConsoleSMSBackend
+    assert "no_such_package" not in sys.modules
+
+
+def test_registered_provider_wins(make_package):
+    package = make_package(
+        "reg_pkg",
+        {
+            "base": PROVIDER_BASE.format(name="Base"),
+            "good": """
+                from sage_sms.design.interfaces.provider import sms_provider
+                from reg_pkg.base import Base
+
+
+                class Helper(Base):
+                    pass
+
+
+                @sms_provider("good")
+                class Good(Base):
+                    pass
+            """,
+        },
+    )
+    backend = SMSBackendFactory(settings("good"), package).get_backend()
+    assert backend.__qualname__ == "Good"
+
+
+def test_provider_name_must_match_its_module(make_package):
+    package = make_package(
+        "mismatch_pkg",
+        {
+            "base": PROVIDER_BASE.format(name="Base"),
+            "twilio_backend": """
+                from mismatch_pkg.base import Base
+                from sage_sms.design.interfaces.provider import sms_provider
+
+
+                @sms_provider("twilio")
+                class Twilio(Base):
+                    pass
+            """,
+        },
+    )
+    with pytest.raises(ValueError, match="must match the backend module's name"):
+        import_module(f"{package}.twilio_backend")
+    assert provider_module.get_sms_provider(package, "twilio") is None
+
+
+def test_backend_class_attribute_is_used(make_package):
+    package = make_package(
+        "attr_pkg",
+        {
+            "base": PROVIDER_BASE.format(name="Base"),
+            "good": """
+                from attr_pkg.base import Base
+
+
+                class Helper(Base):
+                    pass
+
+
+                class Good(Base):
+                    pass
+
+
+                BACKEND_CLASS = Good
+            """,
+        },
+    )
+    backend = SMSBackendFactory(settings("good"), package).get_backend()
+    assert backend.__qualname__ == "Good"
+
+
+def test_subclass_defined_in_module_is_found(make_package):
+    package = make_package(
+        "walk_pkg",
+        {
+            "base": PROVIDER_BASE.format(name="Base"),
+            "good": """
+                from walk_pkg.base import Base
+
+
+                class Good(Base):
+                    pass
+            """,
+        },
+    )
+    backend = SMSBackendFactory(settings("good"), package).get_backend()
+    assert (backend.__module__, backend.__qualname__) == ("walk_pkg.good", "Good")
+
+
+def test_reexported_provider_is_found(make_package):
+    package = make_package(
+        "reexport_pkg",
+        {
+            "impl": PROVIDER_BASE.format(name="Good"),
+            "good": "from reexport_pkg.impl import Good\n",
+        },
+    )
+    backend = SMSBackendFactory(settings("good"), package).get_backend()
+    assert (backend.__module__, backend.__qualname__) == ("reexport_pkg.impl", "Good")
+
+
+def test_backend_class_is_cached(make_package):
+    package = make_package("cache_pkg", {"good": PROVIDER_BASE.format(name="Good")})
+    backend = SMSBackendFactory(settings("good"), package).get_backend()
+    del sys.modules["cache_pkg.good"]
+    assert SMSBackendFactory(settings("good"), package).get_backend() is backend
+    assert "cache_pkg.good" not in sys.modules
+
+
+def test_registrations_are_scoped_to_their_package(make_package):
+    package_a = make_package(
+        "pkg_a",
+        {
+            "base": PROVIDER_BASE.format(name="Base"),
+            "good": """
+                from pkg_a.base import Base
+                from sage_sms.design.interfaces.provider import sms_provider
+
+
+                @sms_provider("good")
+                class Good(Base):
+                    pass
+            """,
+        },
+    )
+    package_b = make_package("pkg_b", {"other": PROVIDER_BASE.format(name="Other")})
+    backend = SMSBackendFactory(settings("good"), package_a).get_backend()
+    assert backend.__module__ == "pkg_a.good"
+    assert provider_module.get_sms_provider(package_a, "good") is backend
+    assert provider_module.get_sms_provider(package_b, "good") is None
+    with pytest.raises(SMSProviderNotFoundError):
+        SMSBackendFactory(settings("good"), package_b)
+
+
+def test_missing_module_raises_not_found(make_package):
+    package = make_package("empty_pkg", {})
+    with pytest.raises(SMSProviderNotFoundError, match="Unsupported provider: nope"):
+        SMSBackendFactory(settings("nope"), package)
+
+
+def test_module_without_provider_raises_not_found(make_package):
+    package = make_package("plain_pkg", {"plain": "VALUE = 1\n"})
+    with pytest.raises(SMSProviderNotFoundError):
+        SMSBackendFactory(settings("plain"), package)
+
+
+def test_broken_dependency_raises_unexpected_error(make_package):
+    package = make_package("broken_pkg", {"broken": "import not_installed_lib\n"})
+    with pytest.raises(SMSUnexpectedError, match="not_installed_lib") as exc_info:
+        SMSBackendFactory(settings("broken"), package)
+    assert isinstance(exc_info.value.__cause__, ModuleNotFoundError)
+
+
+@pytest.mark.parametrize("provider", [None, {}, {"NAME": None}, {"NAME": ""}], ids=repr)
+def test_missing_provider_name_raises_configuration_error(provider):
+    with pytest.raises(SMSConfigurationError, match="Provider key is missing"):
+        SMSBackendFactory({"debug": False, "provider": provider}, "any_package")
+
+
+def test_non_string_provider_name_raises_configuration_error():
+    with pytest.raises(SMSConfigurationError, match="NAME must be a string"):
+        SMSBackendFactory(settings(123), "any_package")
+
+
+def test_discover_backends_is_a_deprecated_no_op():
+    with pytest.deprecated_call():
+        BackendModuleLoader.discover_backends("any_package")
+    assert "any_package" not in sys.modules
@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+import pytest
+
+import sage_sms
+
+
+def test_factory_is_imported_on_first_access():
+    code = (
+        "import sys, sage_sms\n"
+        "assert 'sage_sms.factory' not in sys.modules\n"
+        "from sage_sms import SMSBackendFactory\n"
+        "assert 'sage_sms.factory' in sys.modules\n"
+        "assert SMSBackendFactory is sys.modules['sage_sms.factory'].SMSBackendFactory\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_attributes_resolve_to_their_modules():
+    from sage_sms.factory import SMSBackendFactory
+    from sage_sms.validators import PhoneNumberValidator
+
+    assert sage_sms.SMSBackendFactory is SMSBackendFactory
+    assert sage_sms.PhoneNumberValidator is PhoneNumberValidator
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        sage_sms.missing
+
+
+def test_dir_lists_lazy_attributes():
+    assert {"SMSBackendFactory", "PhoneNumberValidator"} <= set(dir(sage_sms))
@@ -0,0 +1,108 @@
+import inspect
+import sys
+
+import pytest
+
+from sage_sms import validators
+from sage_sms.validators import PhoneNumberDescriptor, PhoneNumberValidator
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    validators._get_phonenumbers.cache_clear()
+    validators._parse_e164.cache_clear()
+    yield
+    validators._get_phonenumbers.cache_clear()
+    validators._parse_e164.cache_clear()
+
+
+@pytest.fixture
+def no_phonenumbers(monkeypatch):
+    monkeypatch.setitem(sys.modules, "phonenumbers", None)
+
+
+@pytest.mark.parametrize(
+    "phone_number",
+    ["+989121234567", "+98 912 123 4567", "+98-912-123-4567", "+98.912.123.4567"],
+)
+def test_e164_input_takes_fast_path(no_phonenumbers, phone_number):
+    assert PhoneNumberValidator(phone_number).validate_and_format() == "+989121234567"
+    assert validators._parse_e164.cache_info().misses == 0
+
+
+def test_fast_path_does_not_check_country_code(no_phonenumbers):
+    assert PhoneNumberValidator("+9991234567").validate_and_format() == "+9991234567"
+
+
+def test_non_ascii_digits_fall_back_to_phonenumbers():
+    pytest.importorskip("phonenumbers")
+    validator = PhoneNumberValidator("+98٩١۲1234567")
+    assert validator.validate_and_format() == "+989121234567"
+    assert validators._parse_e164.cache_info().misses == 1
+
+
+@pytest.mark.parametrize(
+    "phone_number, expected",
+    [
+        ("+98 (0) 912 123 4567", "+989121234567"),
+        ("+44 (0)20 7946 0958", "+442079460958"),
+    ],
+)
+def test_parenthesised_trunk_prefix_falls_back_to_phonenumbers(phone_number, expected):
+    pytest.importorskip("phonenumbers")
+    assert PhoneNumberValidator(phone_number).validate_and_format() == expected
+
+
+@pytest.mark.parametrize(
+    "phone_number, expected",
+    [
+        ("+9809121234567", "+989121234567"),
+        ("+4402079460958", "+442079460958"),
+        ("+390612345678", "+390612345678"),
+        ("+98 0912 123 4567", "+989121234567"),
+        ("+44 020 7946 0958", "+442079460958"),
+        ("+98-0912-123-4567", "+989121234567"),
+    ],
+)
+def test_possible_trunk_prefix_falls_back_to_phonenumbers(phone_number, expected):
+    pytest.importorskip("phonenumbers")
+    assert PhoneNumberValidator(phone_number).validate_and_format() == expected
+    assert validators._parse_e164.cache_info().misses == 1
+
+
+def test_national_number_falls_back_to_phonenumbers():
+    pytest.importorskip("phonenumbers")
+    assert PhoneNumberValidator.validate_and_format_many(
+        ["09121234567", "0912 123 4567"], region="IR"
+    ) == ["+989121234567", "+989121234567"]
+
+
+def test_repeated_numbers_are_parsed_once():
+    pytest.importorskip("phonenumbers")
+    PhoneNumberValidator.validate_and_format_many(["09121234567"] * 3, region="IR")
+    cache_info = validators._parse_e164.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (2, 1)
+
+
+def test_validate_and_format_many_keeps_order(no_phonenumbers):
+    phone_numbers = ["+989121234567", "+14155552671", "+61412345678"]
+    assert PhoneNumberValidator.validate_and_format_many(phone_numbers) == (
+        phone_numbers
+    )
+
+
+def test_missing_phonenumbers_raises_import_error(no_phonenumbers):
+    with pytest.raises(ImportError, match="Install `phonenumbers` package"):
+        PhoneNumberValidator("09121234567")
+
+
+def test_descriptor_is_returned_on_class_access():
+    assert isinstance(PhoneNumberValidator.phone_number, PhoneNumberDescriptor)
+    assert hasattr(PhoneNumberValidator, "phone_number")
+    assert "phone_number" in dict(inspect.getmembers(PhoneNumberValidator))
+
+
+def test_validator_uses_slots(no_phonenumbers):
+    validator = PhoneNumberValidator("+989121234567", region="IR")
+    assert not hasattr(validator, "__dict__")
+    assert validator.region == "IR"